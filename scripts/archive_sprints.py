@@ -8,17 +8,32 @@ Moves legacy sprints to archive directory based on:
 2. Naming patterns (v0.x series = legacy)
 3. Age/staleness (no updates in 90+ days)
 
+Sprint age comes from git history (last commit touching the sprint
+directory), read in a single `git log` pass and cached per HEAD commit.
+Filesystem mtimes are only used for sprints git knows nothing about.
+
+Screenshots and other assets in archived sprints are deduplicated through
+the content-addressed store in sprint_assets.py after sprints are moved.
+Pass --assets on a dry run to also report the expected savings (this hashes
+every archived asset).
+
 Active sprints (s8-s11 SL series, etc.) are preserved.
 """
 
 import os
+import json
 import shutil
+import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional, Dict
+
+from sprint_assets import AssetStore, STORE_DIR_NAME, report_dedupe
 
 # Configuration
 SPRINTS_DIR = Path("C:/GitHub/the-grove-foundation/docs/sprints")
 ARCHIVE_DIR = SPRINTS_DIR / "archive"
+STALENESS_CACHE_NAME = "sprint-staleness.json"
 
 # Active sprint patterns - these are NOT archived
 ACTIVE_PATTERNS = [
@@ -70,8 +85,135 @@ def is_legacy_sprint(name: str) -> bool:
     return any(pattern in name_lower for pattern in LEGACY_PATTERNS)
 
 
+def run_git(args: list, cwd: Path) -> Optional[str]:
+    """Run a git command and return stripped stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=str(cwd), capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def scan_sprint_commit_times(sprints_dir: Path) -> Optional[Dict[str, int]]:
+    """
+    Map each sprint directory to the timestamp of its last commit.
+
+    Streams `git log --name-only` over the sprints directory once, newest
+    commit first, so the first time a sprint shows up is its last commit.
+    Archived sprints (archive/<name>) are keyed by their own name too.
+    Returns None if the directory is not inside a git work tree, or the
+    clone is shallow and its history cannot give real ages.
+    """
+    repo_root = run_git(["rev-parse", "--show-toplevel"], sprints_dir)
+    if repo_root is None:
+        return None
+    if run_git(["rev-parse", "--is-shallow-repository"], sprints_dir) == "true":
+        # The boundary commit lists every file as added, so every sprint
+        # would look as new as that commit
+        print("   [WARN] shallow clone: git history is truncated, "
+              "falling back to file modification times for sprint age")
+        return None
+    prefix = sprints_dir.resolve().relative_to(Path(repo_root).resolve()).as_posix()
+    prefix = "" if prefix == "." else prefix + "/"
+
+    cmd = [
+        "git", "-c", "core.quotePath=false", "log",
+        "--name-only", "--no-renames", "--format=%x00%ct",
+        "--", prefix or ".",
+    ]
+    try:
+        proc = subprocess.Popen(
+            cmd, cwd=repo_root, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, encoding="utf-8",
+        )
+    except OSError:
+        return None
+
+    last_commit = {}
+    commit_time = 0
+    for line in proc.stdout:
+        line = line.rstrip("\n")
+        if line.startswith("\x00"):
+            commit_time = int(line[1:])
+            continue
+        if not line.startswith(prefix):
+            continue
+        parts = line[len(prefix):].split("/")
+        if parts[0] == "archive":
+            parts = parts[1:]
+        # Need at least <sprint>/<file>; loose files at the top are not sprints
+        if len(parts) < 2:
+            continue
+        last_commit.setdefault(parts[0], commit_time)
+    proc.stdout.close()
+    if proc.wait() != 0:
+        return None
+    return last_commit
+
+
+def load_sprint_commit_times(sprints_dir: Path) -> Optional[Dict[str, int]]:
+    """
+    Return last-commit timestamps per sprint, cached by HEAD commit.
+
+    The cache lives in the git directory so it never gets committed, and is
+    rebuilt whenever HEAD moves.
+    """
+    head = run_git(["rev-parse", "HEAD"], sprints_dir)
+    git_dir = run_git(["rev-parse", "--absolute-git-dir"], sprints_dir)
+    if head is None or git_dir is None:
+        return None
+
+    cache_path = Path(git_dir) / STALENESS_CACHE_NAME
+    key = sprints_dir.resolve().as_posix()
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get("head") != head:
+        cache = {"head": head, "sprints_dirs": {}}
+
+    cached = cache["sprints_dirs"].get(key)
+    if cached is not None:
+        return cached
+
+    times = scan_sprint_commit_times(sprints_dir)
+    if times is None:
+        return None
+    cache["sprints_dirs"][key] = times
+    try:
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass  # Cache is an optimization; a read-only .git is fine
+    return times
+
+
+_commit_times_memo: Dict[str, Optional[Dict[str, int]]] = {}
+
+
+def get_sprint_commit_times(sprints_dir: Path) -> Optional[Dict[str, int]]:
+    """In-process memo over load_sprint_commit_times."""
+    key = str(sprints_dir)
+    if key not in _commit_times_memo:
+        _commit_times_memo[key] = load_sprint_commit_times(sprints_dir)
+    return _commit_times_memo[key]
+
+
 def get_sprint_age_days(sprint_path: Path) -> int:
-    """Get the age of a sprint based on most recent file modification."""
+    """
+    Get the age of a sprint in days since its last commit.
+
+    Falls back to the most recent file modification time when git is
+    unavailable or the sprint has never been committed.
+    """
+    commit_times = get_sprint_commit_times(sprint_path.parent)
+    if commit_times and sprint_path.name in commit_times:
+        last_commit = datetime.fromtimestamp(commit_times[sprint_path.name])
+        return (datetime.now() - last_commit).days
+
     most_recent = None
     for file_path in sprint_path.rglob("*"):
         if file_path.is_file():
@@ -91,7 +233,7 @@ def categorize_sprints():
     unknown = []
 
     for item in SPRINTS_DIR.iterdir():
-        if not item.is_dir() or item.name == "archive":
+        if not item.is_dir() or item.name in ("archive", STORE_DIR_NAME):
             continue
 
         name = item.name
@@ -111,7 +253,7 @@ def categorize_sprints():
     return sorted(active), sorted(legacy), sorted(unknown)
 
 
-def archive_sprints(dry_run: bool = True):
+def archive_sprints(dry_run: bool = True, report_assets: bool = False):
     """Move legacy sprints to archive directory."""
     ARCHIVE_DIR.mkdir(exist_ok=True)
 
@@ -134,7 +276,12 @@ def archive_sprints(dry_run: bool = True):
         age = get_sprint_age_days(SPRINTS_DIR / name)
         print(f"   - {name} (age: {age} days)")
 
+    store = AssetStore(SPRINTS_DIR)
+
     if dry_run:
+        if report_assets:
+            print("\n[ASSETS] Duplicate screenshots/archives in archive/:")
+            report_dedupe(store.dedupe(dry_run=True), dry_run=True)
         print("\n" + "=" * 60)
         print("DRY RUN - No files moved")
         print("Run with --execute to perform archive")
@@ -164,9 +311,12 @@ def archive_sprints(dry_run: bool = True):
 
     print(f"\nArchived {moved} sprints")
 
+    print("\n[ASSETS] Deduplicating archived screenshots/archives...")
+    report_dedupe(store.dedupe(dry_run=False), dry_run=False)
+
 
 if __name__ == "__main__":
     import sys
 
     dry_run = "--execute" not in sys.argv
-    archive_sprints(dry_run=dry_run)
+    archive_sprints(dry_run=dry_run, report_assets="--assets" in sys.argv)
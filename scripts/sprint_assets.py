@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sprint Asset Store
+
+Content-addressed, deduplicated storage for archived sprint screenshots and
+bundles. The same Playwright screenshots are often committed under several
+sprints; this keeps one blob per unique file and hardlinks every copy to it.
+
+Layout (under docs/sprints/.asset-store, git-ignored):
+    objects/ab/cdef...   one blob per unique sha256
+    manifest.json        path -> sha256/size/mtime, plus how it is stored
+
+Each tracked file is stored as one of:
+- "link":     a hardlink to its blob (still a normal file for git and tools)
+- "unlinked": left untouched because the filesystem refused the hardlink
+
+The store never deletes or empties a file in the work tree, and never keeps
+a second full copy of a file in objects/.
+
+Only archived sprints (docs/sprints/archive) are linked. Linked copies share
+one inode, and tools that rewrite a file in place - Playwright saves
+screenshots with Node's fs.writeFile, which truncates the existing file -
+would change every linked copy and the blob at once. Live sprints get their
+screenshots regenerated; archived ones do not.
+
+Files are hashed once; later runs reuse the manifest entry while size and
+mtime are unchanged.
+
+Usage:
+    python scripts/sprint_assets.py              # Dry run (report savings)
+    python scripts/sprint_assets.py --execute    # Deduplicate
+    python scripts/sprint_assets.py --verify     # Check store and tree
+    python scripts/sprint_assets.py --repair     # Verify and fix problems
+"""
+
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+from typing import Optional, Dict, List, Any
+
+# Configuration
+SPRINTS_DIR = Path("C:/GitHub/the-grove-foundation/docs/sprints")
+STORE_DIR_NAME = ".asset-store"
+ARCHIVE_DIR_NAME = "archive"
+MANIFEST_VERSION = 2
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# File types handled by the store - screenshots, recordings, bundles
+ASSET_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".webm", ".mp4", ".zip", ".pdf",
+}
+
+
+def hash_file(path: Path) -> str:
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for reports."""
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KB", "MB", "GB"):
+        value /= 1024
+        if value < 1024 or unit == "GB":
+            return f"{value:.1f} {unit}"
+
+
+class AssetStore:
+    """Content-addressed blob store plus manifest for one sprints directory."""
+
+    def __init__(self, sprints_dir: Path):
+        self.root = sprints_dir
+        self.scan_dir = sprints_dir / ARCHIVE_DIR_NAME
+        self.store_dir = sprints_dir / STORE_DIR_NAME
+        self.objects_dir = self.store_dir / "objects"
+        self.manifest_path = self.store_dir / "manifest.json"
+        self.files: Dict[str, Dict[str, Any]] = self._load_manifest()
+
+    # -- manifest -----------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "files": self.files},
+                       indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.manifest_path)
+
+    # -- blobs --------------------------------------------------------------
+
+    def blob_path(self, sha: str) -> Path:
+        return self.objects_dir / sha[:2] / sha[2:]
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def iter_assets(self):
+        """Yield asset files under the archived sprints."""
+        for dirpath, dirnames, filenames in os.walk(self.scan_dir):
+            for filename in filenames:
+                if Path(filename).suffix.lower() in ASSET_EXTENSIONS:
+                    yield Path(dirpath) / filename
+
+    def _link_into_place(self, blob: Path, path: Path) -> bool:
+        """Atomically replace path with a hardlink to blob."""
+        tmp = path.with_name(path.name + ".asset-tmp")
+        try:
+            if tmp.exists():
+                tmp.unlink()
+            os.link(blob, tmp)
+            os.replace(tmp, path)
+            return True
+        except OSError:
+            if tmp.exists():
+                tmp.unlink()
+            return False
+
+    # -- operations ---------------------------------------------------------
+
+    def _hash(self, path: Path, rel: str, st: os.stat_result) -> Optional[str]:
+        """Return the recorded hash while size and mtime are unchanged."""
+        entry = self.files.get(rel)
+        if (entry and entry.get("size") == st.st_size
+                and entry.get("mtime_ns") == st.st_mtime_ns):
+            return entry["sha256"]
+        return None
+
+    def dedupe(self, dry_run: bool = True) -> Dict[str, int]:
+        """
+        Ingest every archived asset and hardlink duplicates to shared blobs.
+
+        Returns counts: files scanned, files hashed, duplicates linked, files
+        left unlinked, and bytes reclaimed. Reclaimed bytes only count files
+        whose last link was replaced, so they match the real disk savings.
+        Blobs are re-hashed before anything new is linked to them.
+        """
+        stats = {"scanned": 0, "hashed": 0, "deduped": 0, "unlinked": 0,
+                 "reclaimed": 0}
+        inodes: Dict[str, set] = {}  # sha -> distinct inodes, for dry runs
+        checked = set()  # blobs re-hashed this run before linking to them
+        sizes: Dict[str, int] = {}
+        present = set()
+
+        for path in self.iter_assets():
+            st = path.stat()
+            if st.st_size == 0:
+                continue
+            rel = self._rel(path)
+            present.add(rel)
+            stats["scanned"] += 1
+
+            sha = self._hash(path, rel, st)
+            if sha is None:
+                sha = hash_file(path)
+                stats["hashed"] += 1
+            blob = self.blob_path(sha)
+
+            if dry_run:
+                if sha not in inodes:
+                    inodes[sha] = set()
+                    sizes[sha] = st.st_size
+                    if blob.exists():
+                        blob_st = blob.stat()
+                        inodes[sha].add((blob_st.st_dev, blob_st.st_ino))
+                inodes[sha].add((st.st_dev, st.st_ino))
+                continue
+
+            # A blob shares its inode with tree files, so an in-place edit of
+            # any linked copy rewrites it. Re-hash it once per run before
+            # linking more files to it, and re-seed it from this file if stale.
+            if blob.exists() and sha not in checked:
+                if not os.path.samefile(blob, path) and hash_file(blob) != sha:
+                    print(f"   [WARN] blob {sha[:12]} was modified in place, "
+                          f"re-seeding from {rel}")
+                    blob.unlink()
+                checked.add(sha)
+
+            mode = "link"
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(path, blob)
+                except OSError:
+                    mode = "unlinked"
+            elif not os.path.samefile(blob, path):
+                if self._link_into_place(blob, path):
+                    stats["deduped"] += 1
+                    if st.st_nlink == 1:
+                        stats["reclaimed"] += st.st_size
+                else:
+                    mode = "unlinked"
+            if mode == "unlinked":
+                stats["unlinked"] += 1
+
+            self.files[rel] = {
+                "sha256": sha,
+                "size": st.st_size,
+                "mtime_ns": path.stat().st_mtime_ns,
+                "mode": mode,
+            }
+
+        if dry_run:
+            for sha, keys in inodes.items():
+                stats["deduped"] += len(keys) - 1
+                stats["reclaimed"] += (len(keys) - 1) * sizes[sha]
+        else:
+            # Drop entries for files that vanished or moved
+            for rel in [r for r in self.files if r not in present]:
+                del self.files[rel]
+            self._prune_blobs()
+            self.save()
+        return stats
+
+    def _prune_blobs(self):
+        """Delete blobs no manifest entry points at."""
+        if not self.objects_dir.exists():
+            return
+        wanted = {e["sha256"] for e in self.files.values()}
+        for blob in self.objects_dir.glob("*/*"):
+            if blob.parent.name + blob.name not in wanted:
+                blob.unlink()
+
+    def verify(self, repair: bool = False) -> List[str]:
+        """
+        Check blobs against their hashes and tree files against their blobs.
+
+        With repair=True, corrupt blobs are re-linked to any intact tree copy
+        and missing or corrupt tree files are restored from their blob, as
+        long as their sprint directory still exists. Files replaced since the
+        last dedupe are warned about, never overwritten. Returns a list of
+        problems that remain.
+        """
+        problems = []
+        by_sha: Dict[str, List[str]] = {}
+        for rel, entry in self.files.items():
+            by_sha.setdefault(entry["sha256"], []).append(rel)
+
+        good_blobs = set()
+        for sha, rels in by_sha.items():
+            blob = self.blob_path(sha)
+            if blob.exists() and hash_file(blob) == sha:
+                good_blobs.add(sha)
+                continue
+            if not any(self.files[r]["mode"] == "link" for r in rels):
+                continue  # Never stored; the tree files are the only copies
+            source = self._find_intact_copy(sha, rels) if repair else None
+            if source is not None:
+                if blob.exists():
+                    blob.unlink()
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(source, blob)
+                except OSError as e:
+                    problems.append(f"blob {sha[:12]} could not be rebuilt: {e}")
+                    continue
+                good_blobs.add(sha)
+                print(f"   [FIX] rebuilt blob {sha[:12]} from {self._rel(source)}")
+            else:
+                problems.append(f"blob {sha[:12]} missing or corrupt "
+                                f"({len(rels)} file(s))")
+
+        for rel, entry in sorted(self.files.items()):
+            sha = entry["sha256"]
+            path = self.root / rel
+            blob = self.blob_path(sha)
+            if path.exists():
+                st = path.stat()
+                if (st.st_size, st.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+                    # Normal edit; the next dedupe run picks it up
+                    print(f"   [WARN] {rel}: changed since last dedupe "
+                          f"(rerun with --execute)")
+                    continue
+                if sha in good_blobs and os.path.samefile(path, blob):
+                    continue
+                if hash_file(path) == sha:
+                    continue
+            if not self._sprint_dir(rel).is_dir():
+                # Sprint was deleted; the next dedupe run drops its entries
+                print(f"   [WARN] {rel}: sprint directory removed, not restoring")
+                continue
+            state = "missing" if not path.exists() else "corrupt"
+            if not repair or sha not in good_blobs:
+                problems.append(f"{rel}: {state}")
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self._link_into_place(blob, path):
+                entry["mode"] = "link"
+            else:
+                shutil.copy2(blob, path)
+                entry["mode"] = "unlinked"
+            entry["mtime_ns"] = path.stat().st_mtime_ns
+            print(f"   [FIX] restored {rel}")
+
+        if repair:
+            self.save()
+        return problems
+
+    def _sprint_dir(self, rel: str) -> Path:
+        """Return the archived sprint directory (archive/<sprint>) of rel."""
+        return self.root.joinpath(*rel.split("/")[:2])
+
+    def _find_intact_copy(self, sha: str, rels: List[str]) -> Optional[Path]:
+        """Return a tree file whose content still matches sha, if any."""
+        for rel in rels:
+            path = self.root / rel
+            if path.exists() and hash_file(path) == sha:
+                return path
+        return None
+
+
+def report_dedupe(stats: Dict[str, int], dry_run: bool):
+    """Print a dedupe summary, including the space reclaimed."""
+    verb = "Would reclaim" if dry_run else "Reclaimed"
+    print(f"   Scanned {stats['scanned']} assets, hashed {stats['hashed']}")
+    print(f"   Duplicates: {stats['deduped']}")
+    if stats["unlinked"]:
+        print(f"   [WARN] {stats['unlinked']} files left as-is "
+              f"(filesystem refused hardlinks)")
+    print(f"   {verb} {format_bytes(stats['reclaimed'])}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    store = AssetStore(SPRINTS_DIR)
+
+    if "--verify" in sys.argv or "--repair" in sys.argv:
+        repair = "--repair" in sys.argv
+        print("=" * 60)
+        print("ASSET STORE " + ("REPAIR" if repair else "VERIFY"))
+        print("=" * 60)
+        problems = store.verify(repair=repair)
+        for problem in problems:
+            print(f"   [ERR] {problem}")
+        print(f"\n{len(store.files)} files tracked, {len(problems)} problems")
+        sys.exit(1 if problems else 0)
+
+    dry_run = "--execute" not in sys.argv
+    print("=" * 60)
+    print("SPRINT ASSET DEDUPLICATION" + (" (DRY RUN)" if dry_run else ""))
+    print("=" * 60)
+    report_dedupe(store.dedupe(dry_run=dry_run), dry_run)
+    if dry_run:
+        print("\nRun with --execute to deduplicate")